@@ -0,0 +1,162 @@
+"""
+Quebra de linhas "optimal fit" para o TextFormatter.
+
+Em vez de preencher cada linha o máximo possível (first-fit guloso), escolhe o
+conjunto de quebras que minimiza a soma dos quadrados das sobras de cada linha
+(a última linha não é penalizada). O resultado tem linhas de comprimento mais
+uniforme, o que reduz os gaps exagerados na justificação.
+
+O custo de uma linha depende só de onde ela começa e termina, e a matriz de
+custos é totalmente monótona; por isso as quebras ótimas são encontradas com
+o algoritmo SMAWK em sua versão "online" (cada coluna depende do mínimo das
+anteriores), em tempo linear no número de palavras. A implementação segue a
+de Eppstein (PADS) e a do crate `textwrap`.
+"""
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+
+def _smawk(matrix: Callable[[int, int], int], rows: List[int], cols: List[int], minima: Dict[int, int]) -> None:
+    """
+    Mínimo de cada coluna de uma submatriz totalmente monótona (SMAWK).
+
+    Escreve em `minima[col]` a linha que contém o mínimo da coluna `col`, para
+    cada `col` em `cols`.
+    """
+    if not cols:
+        return
+    stack: List[int] = []
+    for r in rows:
+        while stack and matrix(stack[-1], cols[len(stack) - 1]) > matrix(r, cols[len(stack) - 1]):
+            stack.pop()
+        if len(stack) != len(cols):
+            stack.append(r)
+    rows = stack
+    _smawk(matrix, rows, cols[1::2], minima)
+    r = 0
+    for c in range(0, len(cols), 2):
+        col = cols[c]
+        row = rows[r]
+        last_row = rows[-1] if c == len(cols) - 1 else minima[cols[c + 1]]
+        best = (matrix(row, col), row)
+        while row != last_row:
+            r += 1
+            row = rows[r]
+            best = min(best, (matrix(row, col), row))
+        minima[col] = best[1]
+
+
+def _online_column_minima(
+    size: int, matrix: Callable[[List[Tuple[int, int]], int, int], int]
+) -> List[Tuple[int, int]]:
+    """
+    Mínimos de coluna de uma matriz triangular totalmente monótona "online".
+
+    `matrix(result, i, j)` (com `i < j`) pode usar os mínimos já calculados
+    em `result[:j]`. Retorna, para cada coluna `j`, o par `(i, valor)` da
+    linha que a minimiza; a coluna 0 vale `(0, 0)`.
+    """
+    result: List[Tuple[int, int]] = [(0, 0)]
+    finished = 0
+    base = 0
+    tentative = 0
+
+    def m(i: int, j: int) -> int:
+        return matrix(result, i, j)
+
+    while finished < size - 1:
+        i = finished + 1
+        if i > tentative:
+            # Novo valor tentativo: SMAWK na maior submatriz quadrada abaixo de `base`.
+            rows = list(range(base, finished + 1))
+            tentative = min(finished + len(rows), size - 1)
+            cols = list(range(finished + 1, tentative + 1))
+            minima: Dict[int, int] = {}
+            _smawk(m, rows, cols, minima)
+            for col in cols:
+                row = minima[col]
+                v = m(row, col)
+                if col >= len(result):
+                    result.append((row, v))
+                elif v < result[col][1]:
+                    result[col] = (row, v)
+            finished = i
+            continue
+        diag = m(i - 1, i)
+        if diag < result[i][1]:
+            # O mínimo está na diagonal: as linhas anteriores não servem mais.
+            result[i] = (i - 1, diag)
+            base = i - 1
+            tentative = i
+            finished = i
+            continue
+        if m(i - 1, tentative) >= result[tentative][1]:
+            finished = i
+            continue
+        base = i - 1
+        tentative = i
+        finished = i
+    return result
+
+
+def _line_cost(lens: Sequence[int], width: int) -> Callable[[int, int], int]:
+    """
+    Custo `line_cost(i, j)` de uma linha com as palavras `lens[i:j]`.
+
+    Linhas que não são a última custam `(width - comprimento) ** 2`. Linhas
+    que ultrapassam `width` recebem uma penalidade maior que qualquer soma de
+    sobras, de modo que isso só acontece quando inevitável (uma palavra maior
+    que `width`, que fica sozinha na linha, como no first-fit).
+    """
+    n = len(lens)
+    prefix = [0] * (n + 1)
+    for k, wl in enumerate(lens):
+        prefix[k + 1] = prefix[k] + wl
+    overflow_penalty = (n + 1) * (max(width, 0) + 1) ** 2
+
+    def line_cost(i: int, j: int) -> int:
+        line_len = prefix[j] - prefix[i] + (j - i - 1)
+        if line_len > width:
+            return (line_len - width) * overflow_penalty
+        if j < n:
+            return (width - line_len) ** 2
+        return 0
+
+    return line_cost
+
+
+def optimal_line_starts(lens: Sequence[int], width: int) -> List[int]:
+    """
+    Índice da primeira palavra de cada linha na quebra ótima.
+
+    Minimiza a soma dos custos de linha de `_line_cost`.
+
+    Parameters
+    ----------
+    lens : Sequence[int]
+        Comprimento de cada palavra, na ordem.
+    width : int
+        Largura máxima por linha.
+
+    Returns
+    -------
+    List[int]
+        Índices (crescentes, começando em 0) das palavras que abrem cada linha.
+    """
+    n = len(lens)
+    if n == 0:
+        return []
+    line_cost = _line_cost(lens, width)
+
+    def cost(result: List[Tuple[int, int]], i: int, j: int) -> int:
+        return result[i][1] + line_cost(i, j)
+
+    minima = _online_column_minima(n + 1, cost)
+    starts: List[int] = []
+    j = n
+    while j > 0:
+        j = minima[j][0]
+        starts.append(j)
+    starts.reverse()
+    return starts
+
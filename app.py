@@ -8,6 +8,7 @@ separar a lógica de formatação (classe TextFormatter) da camada HTTP (FastAPI
 Endpoints
 - POST /format: recebe JSON com texto e opções de formatação e retorna o texto
   formatado e uma lista com as linhas resultantes.
+  Com `?stream=true` as linhas são enviadas em streaming (NDJSON).
 - GET /: rota de sanity-check que indica que a API está ativa.
 
 Exemplo de requisição (curl):
@@ -27,14 +28,58 @@ Observações:
   internos de cada parágrafo antes de aplicar wrap/justify.
 - A classe TextFormatter é independente de FastAPI e pode ser reutilizada em
   outros contextos (CLI, scripts, testes unitários, etc.).
+- Se `numba` estiver instalado, o wrap e a justificação de parágrafos ASCII
+  são feitos por kernels compilados (JIT); sem ele, usa-se a implementação
+  em Python puro.
 """
 
-from typing import List
-from fastapi import FastAPI
-from pydantic import BaseModel
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from array import array
+from itertools import repeat
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Literal, Sequence, Tuple, TypeVar
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
+import asyncio
+import multiprocessing
+import os
 import re
+import threading
 
-app = FastAPI(title="String Formatter API (OOP)")
+import orjson
+
+from _optimal_fit import optimal_line_starts
+
+try:
+    import numpy as np
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Separador de parágrafos: linha em branco (possivelmente com espaços).
+_PARA_RE = re.compile(r'\n\s*\n')
+
+# Critérios de quebra de linha aceitos pelo formatter.
+WrapAlgorithm = Literal["first_fit", "optimal_fit"]
+
+T = TypeVar("T")
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Encerra os processos de `_CPU_POOL` quando o servidor para."""
+    yield
+    if _CPU_POOL is not None:
+        _CPU_POOL.shutdown(cancel_futures=True)
+
+
+app = FastAPI(title="String Formatter API (OOP)", lifespan=_lifespan)
 
 
 class FormatRequest(BaseModel):
@@ -54,12 +99,286 @@ class FormatRequest(BaseModel):
     justify_last_line : bool, optional
         Se True, também justifica a última linha de cada parágrafo. Caso contrário
         a última linha fica alinhada à esquerda. Padrão: False.
+    algorithm : {"first_fit", "optimal_fit"}, optional
+        Critério de quebra de linha. "first_fit" preenche cada linha o máximo
+        possível (mais rápido); "optimal_fit" minimiza a soma dos quadrados
+        das sobras, gerando linhas mais uniformes e gaps menores ao justificar.
+        Padrão: "first_fit".
     """
 
     text: str
     width: int = 40
     justify: bool = False
     justify_last_line: bool = False
+    algorithm: WrapAlgorithm = "first_fit"
+
+
+if _HAS_NUMBA:
+    # Os kernels não tocam objetos Python e liberam o GIL (`nogil=True`): no
+    # modo streaming rodam em threads do Starlette sem travar o event loop.
+
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _word_offsets_nb(buf, out, starts, ends):
+        """
+        Localiza as palavras de `buf` (bytes ASCII) em uma única passada.
+
+        As palavras são copiadas para `out` separadas por um único espaço; os
+        offsets de início/fim de cada palavra (relativos a `out`) são escritos
+        em `starts`/`ends`. Os separadores são os mesmos de `str.split()` para
+        ASCII: \\t \\n \\v \\f \\r, 0x1c-0x1f e espaço. Como quase todo
+        byte de texto é > 0x20, um único teste `b <= 32` descarta o caso comum
+        antes de classificar o separador.
+
+        Returns
+        -------
+        int
+            Número de palavras encontradas.
+        """
+        n = 0
+        pos = 0
+        in_word = False
+        for i in range(buf.shape[0]):
+            b = buf[i]
+            if b <= 32 and (b == 32 or 9 <= b <= 13 or b >= 28):
+                if in_word:
+                    ends[n] = pos
+                    n += 1
+                    in_word = False
+            else:
+                if not in_word:
+                    if n > 0:
+                        out[pos] = 32
+                        pos += 1
+                    starts[n] = pos
+                    in_word = True
+                out[pos] = b
+                pos += 1
+        if in_word:
+            ends[n] = pos
+            n += 1
+        return n
+
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _wrap_paragraph_nb(starts, ends, width, line_starts, line_ends):
+        """
+        Kernel do wrap guloso (first-fit) sobre os offsets das palavras.
+
+        Escreve em `line_starts`/`line_ends` os offsets de início/fim de cada
+        linha (no mesmo texto de `starts`/`ends`) e retorna a quantidade de
+        linhas.
+        """
+        lines = 0
+        curr_len = 0
+        for i in range(starts.shape[0]):
+            wl = ends[i] - starts[i]
+            if curr_len != 0 and curr_len + 1 + wl <= width:
+                curr_len += 1 + wl
+            else:
+                if lines:
+                    line_ends[lines - 1] = ends[i - 1]
+                line_starts[lines] = starts[i]
+                lines += 1
+                curr_len = wl
+        if lines:
+            line_ends[lines - 1] = ends[starts.shape[0] - 1]
+        return lines
+
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _justify_paragraph_nb(buf, starts, ends, width, justify_last_line):
+        """
+        Kernel de wrap (first-fit) + justificação de um parágrafo inteiro.
+
+        Trabalha só sobre a tabela de palavras (`starts`/`ends` em `buf`, o
+        texto normalizado) e escreve todas as linhas, concatenadas, em um
+        único buffer. As regras são as de `TextFormatter.justify_line`.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            Buffer com as linhas e o offset de fim de cada linha nele.
+        """
+        n = starts.shape[0]
+        first = np.empty(n + 1, dtype=np.int32)
+        lines = 0
+        curr_len = 0
+        size = 0
+        for i in range(n):
+            wl = ends[i] - starts[i]
+            if curr_len != 0 and curr_len + 1 + wl <= width:
+                curr_len += 1 + wl
+            else:
+                if lines:
+                    size += max(curr_len, width)
+                first[lines] = i
+                lines += 1
+                curr_len = wl
+        first[lines] = n
+        if lines:
+            size += max(curr_len, width) if justify_last_line else curr_len
+
+        out = np.empty(size, dtype=np.uint8)
+        line_ends = np.empty(lines, dtype=np.int64)
+        pos = 0
+        for k in range(lines):
+            a = first[k]
+            b = first[k + 1]
+            if k == lines - 1 and not justify_last_line:
+                # Última linha alinhada à esquerda: já está normalizada em `buf`.
+                wl = ends[b - 1] - starts[a]
+                out[pos:pos + wl] = buf[starts[a]:ends[b - 1]]
+                pos += wl
+            elif b - a == 1:
+                wl = ends[a] - starts[a]
+                out[pos:pos + wl] = buf[starts[a]:ends[a]]
+                pos += wl
+                if wl < width:
+                    out[pos:pos + width - wl] = 32
+                    pos += width - wl
+            else:
+                total = 0
+                for i in range(a, b):
+                    total += ends[i] - starts[i]
+                gaps = b - a - 1
+                base_space = (width - total) // gaps
+                extra = (width - total) % gaps
+                for i in range(a, b):
+                    wl = ends[i] - starts[i]
+                    out[pos:pos + wl] = buf[starts[i]:ends[i]]
+                    pos += wl
+                    if i < b - 1:
+                        spaces = base_space + (1 if i - a < extra else 0)
+                        out[pos:pos + spaces] = 32
+                        pos += spaces
+            line_ends[k] = pos
+        return out, line_ends
+
+
+def _word_table_ascii(paragraph: str) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Tabela de palavras (SoA) de um parágrafo ASCII, em uma única passada.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        Buffer com o texto normalizado e os offsets de início/fim de cada
+        palavra nele. Nenhuma `str` é criada por palavra.
+    """
+    buf = np.frombuffer(paragraph.encode("ascii"), dtype=np.uint8)
+    size = buf.shape[0]
+    out = np.empty(size, dtype=np.uint8)
+    starts = np.empty(size // 2 + 1, dtype=np.int32)
+    ends = np.empty(size // 2 + 1, dtype=np.int32)
+    n = _word_offsets_nb(buf, out, starts, ends)
+    return out, starts[:n], ends[:n]
+
+
+def _collapse_ws_ascii(paragraph: str) -> Tuple[str, "np.ndarray", "np.ndarray"]:
+    """
+    Normaliza os espaços de um parágrafo ASCII em uma única passada.
+
+    Equivale a `" ".join(paragraph.split())`, mas sem criar a lista de
+    palavras: o kernel escreve o texto normalizado em um buffer pré-alocado,
+    decodificado uma única vez no final.
+
+    Returns
+    -------
+    Tuple[str, numpy.ndarray, numpy.ndarray]
+        Texto normalizado e os offsets de início/fim de cada palavra nele.
+    """
+    out, starts, ends = _word_table_ascii(paragraph)
+    collapsed = out[:ends[-1]].tobytes().decode("ascii") if starts.shape[0] else ""
+    return collapsed, starts, ends
+
+
+def _wrap_paragraph_ascii(paragraph: str, width: int) -> List[str]:
+    """
+    Wrap de um parágrafo ASCII usando os kernels Numba.
+
+    Para ASCII um byte corresponde a um caractere, então os offsets em bytes
+    valem também como larguras. As linhas são fatias do texto normalizado
+    por `_collapse_ws_ascii`, sem criar uma `str` por palavra.
+    """
+    collapsed, starts, ends = _collapse_ws_ascii(paragraph)
+    n = starts.shape[0]
+    line_starts = np.empty(n, dtype=np.int32)
+    line_ends = np.empty(n, dtype=np.int32)
+    count = _wrap_paragraph_nb(starts, ends, width, line_starts, line_ends)
+    return [collapsed[a:b] for a, b in zip(line_starts[:count].tolist(), line_ends[:count].tolist())]
+
+
+def _justify_paragraph_ascii(paragraph: str, width: int, justify_last_line: bool) -> List[str]:
+    """
+    Wrap + justificação de um parágrafo ASCII usando os kernels Numba.
+
+    Palavras e linhas existem só como offsets até o fim: o kernel escreve o
+    parágrafo justificado em um buffer, decodificado uma única vez e fatiado
+    nas linhas.
+    """
+    buf, starts, ends = _word_table_ascii(paragraph)
+    out, line_ends = _justify_paragraph_nb(buf, starts, ends, width, justify_last_line)
+    text = out.tobytes().decode("ascii")
+    bounds = line_ends.tolist()
+    return [text[a:b] for a, b in zip([0] + bounds, bounds)]
+
+
+if _HAS_NUMBA:
+    # Compila os kernels na importação para tirar o custo do JIT da primeira requisição.
+    _wrap_paragraph_ascii("a", 1)
+    _justify_paragraph_ascii("a", 1, False)
+
+
+def _iter_paragraphs(text: str) -> Iterator[str]:
+    """
+    Gera os parágrafos de `text` separados por `_PARA_RE`, como `re.split`.
+
+    Percorre os separadores com `finditer` e fatia o texto sob demanda, sem
+    montar a lista de todos os parágrafos antes de formatar o primeiro.
+    """
+    last = 0
+    for m in _PARA_RE.finditer(text):
+        yield text[last:m.start()]
+        last = m.end()
+    yield text[last:]
+
+
+# Strings de espaços pré-construídas, indexadas pela quantidade de espaços.
+# Cobrem os gaps de qualquer largura usual; acima disso `" " * n` é criado.
+_SPACES: Tuple[str, ...] = tuple(" " * i for i in range(1024))
+
+
+def _word_lengths(words: List[str]) -> array:
+    """
+    Comprimento de cada palavra em um `array('i')`, calculado uma única vez.
+
+    Os mesmos comprimentos servem ao wrap e à justificação (e, em ASCII, às
+    posições no buffer da linha justificada), sem chamar `len` de novo.
+    """
+    return array("i", map(len, words))
+
+
+def _single_line(paragraph: str) -> List[str]:
+    """
+    Linhas de um parágrafo que cabe inteiro em uma linha (lista vazia se não
+    houver palavras).
+
+    Dispensa a quebra de linhas, mas não a normalização: o parágrafo ainda é
+    dividido e juntado, em O(width) já que ele cabe na linha.
+    """
+    words = paragraph.split()
+    return [" ".join(words)] if words else []
+
+
+@lru_cache(maxsize=4096)
+def _space_plan(total_words_len: int, width: int, gaps: int) -> Tuple[int, ...]:
+    """
+    Quantidade de espaços de cada gap de uma linha justificada.
+
+    Os espaços são distribuídos o mais uniformemente possível e os gaps mais à
+    esquerda recebem 1 espaço extra quando a divisão não for exata. Depende só
+    dos três argumentos, que se repetem muito entre linhas, por isso o cache.
+    """
+    base_space, extra = divmod(width - total_words_len, gaps)
+    return tuple(base_space + (1 if i < extra else 0) for i in range(gaps))
 
 
 class TextFormatter:
@@ -86,7 +405,7 @@ class TextFormatter:
         """
         self.default_width = default_width
 
-    def wrap_paragraph(self, paragraph: str, width: int) -> List[str]:
+    def wrap_paragraph(self, paragraph: str, width: int, algorithm: WrapAlgorithm = "first_fit") -> List[str]:
         """
         Quebra um parágrafo em linhas sem ultrapassar a largura `width`.
 
@@ -102,6 +421,9 @@ class TextFormatter:
             Texto do parágrafo (uma única string, sem quebras de parágrafo).
         width : int
             Largura máxima permitida por linha.
+        algorithm : {"first_fit", "optimal_fit"}, optional
+            Critério de quebra: guloso (padrão) ou quebra ótima (ver
+            `_optimal_fit`).
 
         Returns
         -------
@@ -109,26 +431,74 @@ class TextFormatter:
             Lista de linhas resultantes, cada elemento com comprimento <= width
             salvo quando houver palavras maiores que `width`.
         """
-        words = paragraph.split()
-        lines: List[str] = []
-        current: List[str] = []
+        if len(paragraph) <= width:
+            # Mesmo com os espaços originais o parágrafo cabe em uma linha.
+            return _single_line(paragraph)
+        if algorithm == "first_fit" and _HAS_NUMBA and paragraph.isascii():
+            return _wrap_paragraph_ascii(paragraph, width)
+        return self.wrap_words(paragraph.split(), width, algorithm=algorithm)
+
+    def wrap_words(
+        self,
+        words: List[str],
+        width: int,
+        lens: Sequence[int] | None = None,
+        algorithm: WrapAlgorithm = "first_fit",
+    ) -> List[str]:
+        """
+        Quebra uma lista de palavras em linhas sem ultrapassar a largura `width`.
+
+        Mesmas regras de `wrap_paragraph`, mas recebe as palavras já separadas,
+        evitando normalizar e dividir o parágrafo mais de uma vez.
+
+        Parameters
+        ----------
+        words : List[str]
+            Palavras do parágrafo, na ordem (nenhuma contém espaços).
+        width : int
+            Largura máxima permitida por linha.
+        lens : Sequence[int] | None, optional
+            Comprimento de cada palavra (ver `_word_lengths`); calculado aqui
+            se não for informado.
+        algorithm : {"first_fit", "optimal_fit"}, optional
+            Critério de quebra: guloso (padrão) ou quebra ótima (ver
+            `_optimal_fit`).
+
+        Returns
+        -------
+        List[str]
+            Lista de linhas resultantes, com as palavras separadas por um espaço.
+        """
+        if lens is None:
+            lens = _word_lengths(words)
+        bounds = self._line_starts(lens, width, algorithm)
+        bounds.append(len(words))
+        return [" ".join(words[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+    def _line_starts(self, lens: Sequence[int], width: int, algorithm: WrapAlgorithm = "first_fit") -> List[int]:
+        """
+        Agrupa as palavras em linhas pelo critério guloso (first-fit) ou, com
+        `algorithm="optimal_fit"`, pela quebra ótima de `_optimal_fit`.
+
+        Trabalha só com os comprimentos e retorna o índice da primeira palavra
+        de cada linha, para que wrap e justificação fatiem a mesma lista de
+        palavras sem dividir as linhas de novo.
+        """
+        if algorithm == "optimal_fit":
+            return optimal_line_starts(lens, width)
+        starts: List[int] = []
         curr_len = 0
-        for w in words:
-            if curr_len == 0:
-                current.append(w)
-                curr_len = len(w)
-            elif curr_len + 1 + len(w) <= width:
-                current.append(w)
-                curr_len += 1 + len(w)
+        for i, wl in enumerate(lens):
+            if curr_len != 0 and curr_len + 1 + wl <= width:
+                curr_len += 1 + wl
             else:
-                lines.append(" ".join(current))
-                current = [w]
-                curr_len = len(w)
-        if current:
-            lines.append(" ".join(current))
-        return lines
+                starts.append(i)
+                curr_len = wl
+        return starts
 
-    def justify_line(self, words: List[str], width: int) -> str:
+    def justify_line(
+        self, words: List[str], width: int, lens: Sequence[int] | None = None
+    ) -> str:
         """
         Justifica uma linha (lista de palavras) para que ocupe exatamente `width`.
 
@@ -142,6 +512,8 @@ class TextFormatter:
             Lista de palavras que compõem a linha (não contém espaços).
         width : int
             Largura final desejada para a linha (número de caracteres).
+        lens : Sequence[int] | None, optional
+            Comprimento de cada palavra, se já conhecido (evita recalcular).
 
         Returns
         -------
@@ -153,26 +525,26 @@ class TextFormatter:
             return ""
         if len(words) == 1:
             return words[0] + " " * max(0, width - len(words[0]))
-        total_words_len = sum(len(w) for w in words)
-        total_spaces = width - total_words_len
-        gaps = len(words) - 1
-        base_space, extra = divmod(total_spaces, gaps)
-        parts: List[str] = []
-        for i, w in enumerate(words):
-            parts.append(w)
-            if i < gaps:
-                spaces = base_space + (1 if i < extra else 0)
-                parts.append(" " * spaces)
+        if lens is None:
+            lens = _word_lengths(words)
+        total_words_len = sum(lens)
+        plan = _space_plan(total_words_len, width, len(words) - 1)
+        # Palavras nas posições pares e gaps nas ímpares, preenchidas por fatia.
+        parts: List[str] = [""] * (2 * len(words) - 1)
+        parts[0::2] = words
+        parts[1::2] = [_SPACES[spaces] if 0 <= spaces < len(_SPACES) else " " * spaces for spaces in plan]
         return "".join(parts)
 
-    def justify_paragraph(self, paragraph: str, width: int, justify_last_line: bool = False) -> List[str]:
+    def justify_paragraph(
+        self, paragraph: str, width: int, justify_last_line: bool = False, algorithm: WrapAlgorithm = "first_fit"
+    ) -> List[str]:
         """
         Aplica wrap e justificação a um parágrafo completo.
 
-        A entrada é primeiro quebrada em linhas com `wrap_paragraph`. Em seguida,
-        cada linha é justificada com `justify_line` exceto a última, que por
-        padrão é retornada alinhada à esquerda a menos que
-        `justify_last_line=True`.
+        A entrada é primeiro quebrada em linhas (mesmo critério de
+        `wrap_paragraph`). Em seguida, cada linha é justificada com
+        `justify_line` exceto a última, que por padrão é retornada alinhada à
+        esquerda a menos que `justify_last_line=True`.
 
         Parameters
         ----------
@@ -182,32 +554,56 @@ class TextFormatter:
             Largura alvo para as linhas.
         justify_last_line : bool, optional
             Se True, justifica também a última linha do parágrafo.
+        algorithm : {"first_fit", "optimal_fit"}, optional
+            Critério de quebra: guloso (padrão) ou quebra ótima (ver
+            `_optimal_fit`).
 
         Returns
         -------
         List[str]
             Lista de linhas do parágrafo, justificadas conforme opção.
         """
-        wrapped = self.wrap_paragraph(paragraph, width)
+        if len(paragraph) <= width and not justify_last_line:
+            # Uma única linha, que é a última: fica alinhada à esquerda.
+            return _single_line(paragraph)
+        if algorithm == "first_fit" and _HAS_NUMBA and paragraph.isascii():
+            return _justify_paragraph_ascii(paragraph, width, justify_last_line)
+        return self._justify_words(paragraph.split(), width, justify_last_line, algorithm)
+
+    def _justify_words(
+        self,
+        words: List[str],
+        width: int,
+        justify_last_line: bool = False,
+        algorithm: WrapAlgorithm = "first_fit",
+    ) -> List[str]:
+        """
+        Versão de `justify_paragraph` que recebe as palavras já separadas.
+        """
+        lens = _word_lengths(words)
+        bounds = self._line_starts(lens, width, algorithm)
+        bounds.append(len(words))
         justified: List[str] = []
-        for i, line in enumerate(wrapped):
-            words = line.split()
-            if i == len(wrapped) - 1 and not justify_last_line:
-                justified.append(" ".join(words))
+        for a, b in zip(bounds, bounds[1:]):
+            if b == len(words) and not justify_last_line:
+                justified.append(" ".join(words[a:b]))
             else:
-                justified.append(self.justify_line(words, width))
+                justified.append(self.justify_line(words[a:b], width, lens[a:b]))
         return justified
 
-    def format_text(self, text: str, width: int | None = None, justify: bool = False, justify_last_line: bool = False) -> str:
+    def format_text(
+        self,
+        text: str,
+        width: int | None = None,
+        justify: bool = False,
+        justify_last_line: bool = False,
+        algorithm: WrapAlgorithm = "first_fit",
+    ) -> str:
         """
         Formata um texto completo possivelmente com múltiplos parágrafos.
 
-        Fluxo:
-        1. Se `width` for None usa `self.default_width`.
-        2. Separa parágrafos por linhas em branco (regex `\n\s*\n`).
-        3. Normaliza espaços internos de cada parágrafo.
-        4. Para cada parágrafo aplica wrap ou justify conforme `justify`.
-        5. Reúne os parágrafos com uma linha em branco entre eles.
+        Equivale a juntar com `\n` as linhas de `format_text_lines`, o que deixa
+        os parágrafos separados por uma linha em branco.
 
         Parameters
         ----------
@@ -220,6 +616,8 @@ class TextFormatter:
             a menos que `justify_last_line=True`).
         justify_last_line : bool, optional
             Determina se a última linha de cada parágrafo será justificada.
+        algorithm : {"first_fit", "optimal_fit"}, optional
+            Critério de quebra de linha (ver `FormatRequest.algorithm`).
 
         Returns
         -------
@@ -227,50 +625,424 @@ class TextFormatter:
             Texto formatado, com quebras de linha (`\n`) e parágrafos
             separados por uma linha em branco.
         """
+        return "\n".join(self.format_text_lines(text, width, justify, justify_last_line, algorithm))
+
+    def format_text_lines(
+        self,
+        text: str,
+        width: int | None = None,
+        justify: bool = False,
+        justify_last_line: bool = False,
+        algorithm: WrapAlgorithm = "first_fit",
+    ) -> List[str]:
+        """
+        Formata um texto completo e retorna a lista de linhas resultante.
+
+        Parameters
+        ----------
+        text : str
+            Texto de entrada (pode conter múltiplos parágrafos).
+        width : int | None, optional
+            Largura desejada por linha; se None usa `self.default_width`.
+        justify : bool, optional
+            Se True, aplica justificação completa nas linhas (exceto última
+            a menos que `justify_last_line=True`).
+        justify_last_line : bool, optional
+            Determina se a última linha de cada parágrafo será justificada.
+        algorithm : {"first_fit", "optimal_fit"}, optional
+            Critério de quebra de linha (ver `FormatRequest.algorithm`).
+
+        Returns
+        -------
+        List[str]
+            Linhas formatadas, na mesma forma que `format_text(...).splitlines()`.
+        """
+        return list(self.iter_format_lines(text, width, justify, justify_last_line, algorithm))
+
+    def iter_format_lines(
+        self,
+        text: str,
+        width: int | None = None,
+        justify: bool = False,
+        justify_last_line: bool = False,
+        algorithm: WrapAlgorithm = "first_fit",
+    ) -> Iterator[str]:
+        """
+        Gera as linhas formatadas do texto à medida que cada parágrafo é processado.
+
+        Fluxo:
+        1. Se `width` for None usa `self.default_width`.
+        2. Separa parágrafos por linhas em branco (regex `\\n\\s*\\n`).
+        3. Divide cada parágrafo em palavras uma única vez (o que já normaliza
+           os espaços internos).
+        4. Para cada parágrafo aplica wrap ou justify conforme `justify`,
+           quebrando as linhas pelo critério `algorithm`.
+        5. Emite uma linha vazia (`""`) entre parágrafos consecutivos.
+
+        Os parâmetros são os mesmos de `format_text_lines`. Útil para respostas
+        em streaming, pois não mantém a lista completa de linhas em memória.
+
+        Yields
+        ------
+        str
+            Cada linha formatada, na ordem.
+        """
         if width is None:
             width = self.default_width
-        paragraphs = re.split(r'\n\s*\n', text.strip(), flags=re.UNICODE)
-        formatted_paras: List[str] = []
-        for p in paragraphs:
-            p_clean = " ".join(p.split())
-            if justify:
-                lines = self.justify_paragraph(p_clean, width, justify_last_line=justify_last_line)
-            else:
-                lines = self.wrap_paragraph(p_clean, width)
-            formatted_paras.append("\n".join(lines))
-        return "\n\n".join(formatted_paras)
+        if len(text) <= width and "\n" not in text:
+            # Um único parágrafo que cabe em uma linha: sem separar parágrafos.
+            yield from self.format_paragraph(text, width, justify, justify_last_line, algorithm)
+            return
+        for i, p in enumerate(self.split_paragraphs(text)):
+            if i:
+                yield ""
+            yield from self.format_paragraph(p, width, justify, justify_last_line, algorithm)
+
+    def split_paragraphs(self, text: str) -> Iterable[str]:
+        """
+        Separa o texto em parágrafos (blocos separados por linhas em branco).
+
+        Os parágrafos são gerados sob demanda por `_iter_paragraphs` e não
+        são normalizados.
+        """
+        return _iter_paragraphs(text.strip())
+
+    def format_paragraph(
+        self,
+        paragraph: str,
+        width: int,
+        justify: bool = False,
+        justify_last_line: bool = False,
+        algorithm: WrapAlgorithm = "first_fit",
+    ) -> List[str]:
+        """
+        Formata um único parágrafo (wrap ou justify conforme `justify`).
+
+        Os parâmetros são os mesmos de `format_text_lines`, mas `width` é
+        obrigatório. Parágrafos são independentes entre si, o que permite
+        formatá-los em paralelo.
+        """
+        if justify:
+            return self.justify_paragraph(paragraph, width, justify_last_line, algorithm)
+        return self.wrap_paragraph(paragraph, width, algorithm)
 
 
 # Instância do formatter (pode virar dependência com FastAPI Depends se quiser)
 formatter = TextFormatter(default_width=40)
 
+# Textos a partir deste tamanho não entram no cache, para limitar a memória.
+_CACHE_MAX_TEXT = 64 * 1024
+_CACHE_MAX_ENTRIES = 2048
+
+# Cache LRU de resultados `(formatted, lines)`, indexado pelos argumentos de
+# `_do_format`. Vive só no processo principal: é consultado antes de enviar o
+# texto a `_CPU_POOL`, e cada worker não mantém uma cópia própria.
+_format_cache: "OrderedDict[tuple, Tuple[str, Tuple[str, ...]]]" = OrderedDict()
+
+
+def _cache_get(key: tuple) -> Tuple[str, Tuple[str, ...]] | None:
+    """
+    Resultado memorizado para `key`, ou None; um acerto vira o mais recente.
+
+    Requisições repetidas (retries, exemplos fixos, probes) são respondidas
+    sem refazer a formatação.
+    """
+    result = _format_cache.get(key)
+    if result is not None:
+        _format_cache.move_to_end(key)
+    return result
+
+
+def _cache_put(key: tuple, result: Tuple[str, Tuple[str, ...]]) -> None:
+    """
+    Memoriza `result`, descartando o menos recente acima de `_CACHE_MAX_ENTRIES`.
+
+    As linhas ficam em uma tupla porque o resultado é compartilhado entre as
+    respostas.
+    """
+    _format_cache[key] = result
+    if len(_format_cache) > _CACHE_MAX_ENTRIES:
+        _format_cache.popitem(last=False)
+
+
+# Abaixo deste tamanho (por algoritmo) o texto é formatado direto no event
+# loop; acima vai para `_CPU_POOL`, liberando o loop e contornando o GIL. O
+# limite é onde formatar passa a custar mais que a ida e volta ao pool
+# (~0.2 ms), medido com width=40: o first-fit (kernels Numba) chega lá em
+# ~8 KiB; o optimal-fit (SMAWK em Python puro) em ~256 caracteres.
+_INLINE_MAX_TEXT: Dict[WrapAlgorithm, int] = {"first_fit": 8192, "optimal_fit": 256}
 
-@app.post("/format")
-def format_endpoint(req: FormatRequest):
+# Os workers são criados por um processo servidor limpo (forkserver), e não
+# por fork do processo do uvicorn, que já tem várias threads rodando. Onde
+# forkserver não existe (Windows) usa-se spawn, disponível em toda plataforma.
+_CPU_WORKERS = os.cpu_count() or 1
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+_CPU_POOL: ProcessPoolExecutor | None = None
+_CPU_POOL_LOCK = threading.Lock()
+
+
+def _cpu_pool() -> ProcessPoolExecutor:
+    """
+    Pool de processos usado para formatar textos grandes, criado no primeiro uso.
+
+    Os workers importam este módulo; criar o pool só quando ele é usado evita
+    que cada worker monte (e, se morrer, vaze) um pool próprio.
+    """
+    global _CPU_POOL
+    with _CPU_POOL_LOCK:
+        if _CPU_POOL is None:
+            _CPU_POOL = ProcessPoolExecutor(max_workers=_CPU_WORKERS, mp_context=_MP_CONTEXT)
+        return _CPU_POOL
+
+
+def _discard_cpu_pool(broken: ProcessPoolExecutor) -> None:
+    """
+    Descarta `broken` para que `_cpu_pool` crie um pool novo.
+
+    Um worker morto (por exemplo, OOM kill em um texto enorme) deixa o pool
+    inutilizável para sempre (`BrokenProcessPool`). Só o primeiro a notar
+    descarta o pool; quem chegar depois já encontra o novo.
+    """
+    global _CPU_POOL
+    with _CPU_POOL_LOCK:
+        if _CPU_POOL is broken:
+            _CPU_POOL = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_cpu_pool(fn: Callable[..., T], *args) -> T:
+    """
+    Executa `fn(*args)` em `_CPU_POOL` sem bloquear o event loop.
+
+    Se o pool estiver quebrado, ele é descartado e a chamada é repetida uma
+    vez em um pool novo; se quebrar de novo, o erro sobe (e as próximas
+    requisições também recebem um pool novo).
+    """
+    loop = asyncio.get_running_loop()
+    pool = _cpu_pool()
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        _discard_cpu_pool(pool)
+    pool = _cpu_pool()
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        _discard_cpu_pool(pool)
+        raise
+
+
+# Textos a partir deste tamanho, com pelo menos `_PARALLEL_MIN_PARAGRAPHS`
+# parágrafos, têm os parágrafos distribuídos entre os processos de `_CPU_POOL`.
+_PARALLEL_MIN_TEXT = 100_000
+_PARALLEL_MIN_PARAGRAPHS = 4
+
+
+def _do_format(text: str, width: int, justify: bool, justify_last_line: bool, algorithm: WrapAlgorithm):
+    """
+    Formata o texto e retorna `(formatted, lines)`.
+
+    Função de módulo (e não closure) para poder ser enviada aos processos de
+    `_CPU_POOL`. Não consulta o cache, que fica no processo principal.
+    """
+    lines = formatter.format_text_lines(
+        text, width=width, justify=justify, justify_last_line=justify_last_line, algorithm=algorithm
+    )
+    return "\n".join(lines), lines
+
+
+# Quantidade de linhas agrupadas em cada chunk da resposta em streaming.
+_STREAM_BATCH_LINES = 256
+
+
+def _format_one_para(
+    paragraph: str, width: int, justify: bool, justify_last_line: bool, algorithm: WrapAlgorithm
+) -> List[str]:
+    """Formata um parágrafo; função de módulo para ser enviada a `_CPU_POOL`."""
+    return formatter.format_paragraph(paragraph, width, justify, justify_last_line, algorithm)
+
+
+def _do_format_parallel(text: str, width: int, justify: bool, justify_last_line: bool, algorithm: WrapAlgorithm):
+    """
+    Formata textos grandes distribuindo os parágrafos entre os processos de `_CPU_POOL`.
+
+    Roda em uma thread (bloqueia esperando o pool, não o event loop). Com
+    menos de `_PARALLEL_MIN_PARAGRAPHS` parágrafos o texto inteiro vai para
+    um único processo, como em `_do_format`. Pool quebrado é tratado como em
+    `_run_in_cpu_pool`: descartado, com uma nova tentativa.
+    """
+    paragraphs = list(formatter.split_paragraphs(text))
+    args = (text, width, justify, justify_last_line, algorithm)
+    pool = _cpu_pool()
+    try:
+        return _format_paragraphs_in(pool, paragraphs, *args)
+    except BrokenProcessPool:
+        _discard_cpu_pool(pool)
+    pool = _cpu_pool()
+    try:
+        return _format_paragraphs_in(pool, paragraphs, *args)
+    except BrokenProcessPool:
+        _discard_cpu_pool(pool)
+        raise
+
+
+def _format_paragraphs_in(
+    pool: ProcessPoolExecutor,
+    paragraphs: List[str],
+    text: str,
+    width: int,
+    justify: bool,
+    justify_last_line: bool,
+    algorithm: WrapAlgorithm,
+):
+    """Corpo de `_do_format_parallel`, usando o pool recebido."""
+    n = len(paragraphs)
+    if n < _PARALLEL_MIN_PARAGRAPHS:
+        return pool.submit(_do_format, text, width, justify, justify_last_line, algorithm).result()
+    results = pool.map(
+        _format_one_para,
+        paragraphs,
+        repeat(width, n),
+        repeat(justify, n),
+        repeat(justify_last_line, n),
+        repeat(algorithm, n),
+        chunksize=max(1, n // (4 * _CPU_WORKERS)),
+    )
+    lines: List[str] = []
+    for i, para_lines in enumerate(results):
+        if i:
+            lines.append("")
+        lines.extend(para_lines)
+    return "\n".join(lines), lines
+
+
+def _iter_ndjson(
+    text: str, width: int, justify: bool, justify_last_line: bool, algorithm: WrapAlgorithm
+) -> Iterator[bytes]:
+    """
+    Gera a resposta NDJSON do modo streaming: um objeto `{"line": ...}` por linha.
+
+    As linhas são agrupadas em chunks de `_STREAM_BATCH_LINES` para não pagar
+    uma escrita (e uma troca de thread do Starlette) por linha.
+    """
+    chunk: List[bytes] = []
+    lines = formatter.iter_format_lines(
+        text, width=width, justify=justify, justify_last_line=justify_last_line, algorithm=algorithm
+    )
+    for line in lines:
+        chunk.append(orjson.dumps({"line": line}) + b"\n")
+        if len(chunk) == _STREAM_BATCH_LINES:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
+
+
+async def _aiter_ndjson_pooled(
+    text: str, width: int, justify: bool, justify_last_line: bool, algorithm: WrapAlgorithm
+) -> AsyncIterator[bytes]:
+    """
+    Versão de `_iter_ndjson` que formata um parágrafo por vez em `_CPU_POOL`.
+
+    Usada no modo streaming para o optimal-fit, que é Python puro e seguraria
+    o GIL nas threads do Starlette. Cada parágrafo vira um chunk.
+    """
+    for i, paragraph in enumerate(formatter.split_paragraphs(text)):
+        lines = await _run_in_cpu_pool(_format_one_para, paragraph, width, justify, justify_last_line, algorithm)
+        if i:
+            lines.insert(0, "")
+        yield b"".join([orjson.dumps({"line": line}) + b"\n" for line in lines])
+
+
+def _parse_format_request(body: bytes) -> FormatRequest:
+    """
+    Decodifica e valida o corpo JSON diretamente em um `FormatRequest`.
+
+    `model_validate_json` faz o parse e a validação de uma vez no núcleo
+    compilado do pydantic, sem passar pelo `json.loads` + validação de dict
+    que o FastAPI faria. Erros viram `RequestValidationError`, mantendo a
+    resposta 422 padrão do FastAPI.
+    """
+    try:
+        return FormatRequest.model_validate_json(body)
+    except ValidationError as exc:
+        errors = exc.errors(include_url=False)
+        for error in errors:
+            error["loc"] = ("body", *error["loc"])
+        raise RequestValidationError(errors) from exc
+
+
+@app.post(
+    "/format",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": FormatRequest.model_json_schema()}},
+        }
+    },
+)
+async def format_endpoint(request: Request, stream: bool = False):
     """
     Endpoint que formata o texto enviado no corpo da requisição.
 
     Parameters
     ----------
-    req : FormatRequest
-        Objeto pydantic com os parâmetros: text, width, justify e justify_last_line.
+    request : Request
+        Requisição cujo corpo JSON é validado como `FormatRequest` (text, width,
+        justify, justify_last_line e algorithm). O schema continua publicado
+        em /docs.
+    stream : bool, optional
+        Query param. Se True, responde em streaming (NDJSON) em vez de montar o
+        JSON completo. Padrão: False.
 
     Returns
     -------
-    dict
-        JSON com as chaves:
+    Response | StreamingResponse
+        JSON (serializado com `orjson`, sem passar pelo `jsonable_encoder`
+        do FastAPI) com as chaves:
         - "formatted": string contendo o texto completo já formatado (com \n).
         - "lines": lista de strings, cada uma representando uma linha formatada.
+        Com `stream=true`, uma resposta `application/x-ndjson` com um objeto
+        `{"line": "..."}` por linha (linhas vazias separam parágrafos).
 
     Observações
     ----------
     Esta função delega a lógica de formatação para a instância `formatter`, que
     pode ser trocada por injeção de dependência em cenários de produção ou
-    testes.
+    testes. Textos menores que `_CACHE_MAX_TEXT` passam pelo cache LRU
+    (`_cache_get`/`_cache_put`), consultado antes de qualquer envio ao pool;
+    em caso de falta, textos a partir de `_INLINE_MAX_TEXT` (que depende do
+    algoritmo) são formatados em `_CPU_POOL` para não bloquear o event loop,
+    e a partir de
+    `_PARALLEL_MIN_TEXT` os parágrafos são formatados em paralelo.
     """
-    formatted = formatter.format_text(req.text, width=req.width, justify=req.justify, justify_last_line=req.justify_last_line)
-    lines = formatted.splitlines()
-    return {"formatted": formatted, "lines": lines}
+    req = _parse_format_request(await request.body())
+    args = (req.text, req.width, req.justify, req.justify_last_line, req.algorithm)
+    if stream:
+        if req.algorithm == "optimal_fit" and len(req.text) >= _INLINE_MAX_TEXT["optimal_fit"]:
+            return StreamingResponse(_aiter_ndjson_pooled(*args), media_type="application/x-ndjson")
+        return StreamingResponse(_iter_ndjson(*args), media_type="application/x-ndjson")
+    cacheable = len(req.text) < _CACHE_MAX_TEXT
+    cached = _cache_get(args) if cacheable else None
+    if cached is not None:
+        formatted, lines = cached
+    else:
+        loop = asyncio.get_running_loop()
+        if len(req.text) < _INLINE_MAX_TEXT[req.algorithm]:
+            formatted, lines = _do_format(*args)
+        elif len(req.text) < _PARALLEL_MIN_TEXT:
+            formatted, lines = await _run_in_cpu_pool(_do_format, *args)
+        else:
+            formatted, lines = await loop.run_in_executor(None, _do_format_parallel, *args)
+        if cacheable:
+            _cache_put(args, (formatted, tuple(lines)))
+    return Response(
+        content=orjson.dumps({"formatted": formatted, "lines": lines}), media_type="application/json"
+    )
 
 
 @app.get("/")
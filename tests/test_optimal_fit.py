@@ -0,0 +1,56 @@
+"""
+Testes da quebra de linhas "optimal fit" (`_optimal_fit`).
+
+O SMAWK "online" é conferido contra uma programação dinâmica O(n^2) direta,
+usando o mesmo custo de linha (`_line_cost`).
+"""
+
+import random
+from typing import List, Sequence
+
+import pytest
+
+from _optimal_fit import _line_cost, optimal_line_starts
+
+
+def _brute_force_cost(lens: Sequence[int], width: int) -> int:
+    """Custo ótimo por programação dinâmica O(n^2)."""
+    line_cost = _line_cost(lens, width)
+    best = [0]
+    for j in range(1, len(lens) + 1):
+        best.append(min(best[i] + line_cost(i, j) for i in range(j)))
+    return best[-1]
+
+
+def _breaks_cost(lens: Sequence[int], width: int, starts: List[int]) -> int:
+    """Custo total das quebras `starts`."""
+    line_cost = _line_cost(lens, width)
+    bounds = starts + [len(lens)]
+    return sum(line_cost(a, b) for a, b in zip(bounds, bounds[1:]))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(1000):
+        lens = [rng.randint(1, 12) for _ in range(rng.randint(0, 30))]
+        width = rng.randint(1, 30)
+        starts = optimal_line_starts(lens, width)
+        assert starts == sorted(set(starts))
+        assert not lens or starts[0] == 0
+        assert _breaks_cost(lens, width, starts) == _brute_force_cost(lens, width), (lens, width, starts)
+
+
+def test_empty() -> None:
+    assert optimal_line_starts([], 10) == []
+
+
+def test_long_word_gets_its_own_line() -> None:
+    # "aa" + palavra maior que a largura + "bb": a palavra longa fica sozinha.
+    assert optimal_line_starts([2, 15, 2], 10) == [0, 1, 2]
+
+
+def test_prefers_even_lines_over_first_fit() -> None:
+    # first-fit daria "aaa bb" / "cc" / "dddddd" (sobras 0 e 4); a quebra
+    # ótima equilibra as duas primeiras linhas: "aaa" / "bb cc" / "dddddd".
+    assert optimal_line_starts([3, 2, 2, 6], 6) == [0, 1, 3]